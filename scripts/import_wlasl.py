@@ -7,13 +7,12 @@ then copies matching videos to AvatarAssets with proper names.
 """
 
 import os
-import sys
-import shutil
-import json
 from pathlib import Path
 
-# Target glosses we want videos for
-TARGET_GLOSSES = {
+from wlasl_common import copy_videos, find_best_match, write_gloss_list, write_manifest
+
+# Target glosses we want videos for, in output order (duplicates dropped)
+TARGET_GLOSSES = tuple(dict.fromkeys([
     # Greetings
     "hello", "hi", "goodbye", "bye",
     # Polite
@@ -42,7 +41,29 @@ TARGET_GLOSSES = {
     "red", "blue", "green", "yellow", "black", "white", "orange", "pink", "purple", "brown",
     # Numbers
     "one", "two", "three", "four", "five", "six", "seven", "eight", "nine", "ten",
-}
+]))
+
+# Targets keyed by their lowercase, space-stripped lookup form, computed once at import
+_TARGET_DISPLAY = {t.lower().replace(" ", ""): t for t in TARGET_GLOSSES}
+
+def iter_glosses(json_path):
+    """Yield gloss entries from the WLASL JSON, streaming them when ijson is installed."""
+    try:
+        import ijson
+    except ImportError:
+        import json
+        with open(json_path, "rb") as f:
+            yield from json.load(f)
+    else:
+        with open(json_path, "rb") as f:
+            yield from ijson.items(f, "item")
+
+def index_without_spaces(gloss_to_video):
+    """Key videos by gloss with spaces removed, keeping the first gloss on collisions."""
+    index = {}
+    for gloss, video_id in gloss_to_video.items():
+        index.setdefault(gloss.replace(" ", ""), video_id)
+    return index
 
 def main():
     # Paths
@@ -60,22 +81,24 @@ def main():
     # Create output folder
     avatar_assets.mkdir(parents=True, exist_ok=True)
     
-    # Load JSON
-    print("Loading WLASL_v0.3.json...")
-    with open(json_path, "r") as f:
-        wlasl_data = json.load(f)
-    print(f"Loaded {len(wlasl_data)} glosses")
-    
-    # Get list of available video files
-    available_videos = set()
-    for video_file in videos_path.glob("*.mp4"):
-        available_videos.add(video_file.stem)
+    # Get list of available video files (none if videos/ is missing)
+    try:
+        with os.scandir(videos_path) as it:
+            available_videos = {
+                entry.name[:-4] for entry in it
+                if entry.name.endswith(".mp4") and entry.is_file()
+            }
+    except FileNotFoundError:
+        available_videos = set()
     print(f"Found {len(available_videos)} video files in videos/")
     print()
     
-    # Build gloss -> video_id mapping
+    # Stream JSON and build gloss -> video_id mapping
+    print("Loading WLASL_v0.3.json...")
     gloss_to_video = {}
-    for entry in wlasl_data:
+    gloss_count = 0
+    for entry in iter_glosses(json_path):
+        gloss_count += 1
         gloss = entry.get("gloss", "").lower()
         instances = entry.get("instances", [])
         
@@ -85,55 +108,64 @@ def main():
             if video_id in available_videos:
                 gloss_to_video[gloss] = video_id
                 break
+    print(f"Loaded {gloss_count} glosses")
     
+    gloss_to_video_nospace = index_without_spaces(gloss_to_video)
     print(f"Mapped {len(gloss_to_video)} glosses to available videos")
     print()
     
+    # Try exact match, with and without spaces, for every target first
+    matches = {}
+    unmatched = []
+    for target_norm, target in _TARGET_DISPLAY.items():
+        video_id = gloss_to_video.get(target_norm) or gloss_to_video_nospace.get(target_norm)
+        if video_id:
+            matches[target] = video_id
+        else:
+            unmatched.append((target_norm, target))
+    
+    # Partial matching only for whatever is left
+    for target_norm, target in unmatched:
+        gloss = find_best_match(target_norm, gloss_to_video)
+        if gloss is not None:
+            matches[target] = gloss_to_video[gloss]
+    
+    # Plain strings are cheaper than building Path objects per target
+    videos_dir = str(videos_path)
+    out_dir = str(avatar_assets)
+    
     # Copy matching videos
-    copied = 0
     copied_list = []
     missing = []
+    jobs = []
+    labels = []
     
-    for target in sorted(TARGET_GLOSSES):
-        target_lower = target.lower().replace(" ", "")
-        
-        # Try exact match
-        video_id = gloss_to_video.get(target_lower)
-        
-        # Try without spaces
-        if not video_id:
-            for gloss, vid in gloss_to_video.items():
-                if target_lower == gloss.replace(" ", ""):
-                    video_id = vid
-                    break
-        
-        # Try partial match
-        if not video_id:
-            for gloss, vid in gloss_to_video.items():
-                if target_lower in gloss or gloss in target_lower:
-                    video_id = vid
-                    break
-        
+    for target in TARGET_GLOSSES:
+        video_id = matches.get(target)
         if not video_id:
             missing.append(target)
             continue
         
         # Copy video
-        src = videos_path / f"{video_id}.mp4"
+        src = os.path.join(videos_dir, f"{video_id}.mp4")
         dst_name = target.lower().replace(" ", "_") + ".mp4"
-        dst = avatar_assets / dst_name
+        dst = os.path.join(out_dir, dst_name)
         
-        if src.exists():
-            print(f"  ✓ {target:15} -> {dst_name} (from {video_id}.mp4)")
-            shutil.copy2(src, dst)
-            copied += 1
-            copied_list.append(target)
-        else:
-            missing.append(target)
+        # video_id came from the videos/ scan, so the source file is known to exist
+        jobs.append((src, dst))
+        labels.append(f"{target:15} -> {dst_name} (from {video_id}.mp4)")
+        copied_list.append(target)
+    
+    results = copy_videos(jobs)
+    for label, was_copied in zip(labels, results):
+        print(f"  ✓ {label}" if was_copied else f"  = {label} (up to date)")
+    copied = sum(results)
     
     print()
     print(f"{'='*50}")
     print(f"Copied {copied} videos to AvatarAssets")
+    if len(jobs) > copied:
+        print(f"{len(jobs) - copied} videos already up to date")
     
     if missing:
         print(f"\nMissing ({len(missing)}):")
@@ -142,21 +174,12 @@ def main():
     
     # Write manifest
     manifest_path = avatar_assets / "manifest.json"
-    manifest = {
-        "source": "WLASL v0.3",
-        "count": copied,
-        "glosses": sorted(copied_list),
-        "missing": sorted(missing)
-    }
-    with open(manifest_path, "w") as f:
-        json.dump(manifest, f, indent=2)
+    write_manifest(manifest_path, "WLASL v0.3", copied_list, missing)
     print(f"\nManifest written to: {manifest_path}")
     
     # List all available glosses
     all_glosses_path = avatar_assets / "_all_available_glosses.txt"
-    with open(all_glosses_path, "w") as f:
-        for gloss in sorted(gloss_to_video.keys()):
-            f.write(f"{gloss}\n")
+    write_gloss_list(all_glosses_path, gloss_to_video)
     print(f"All glosses written to: {all_glosses_path}")
 
 if __name__ == "__main__":
@@ -9,11 +9,10 @@ This script copies videos for common phrases to the AvatarAssets folder,
 renaming them to match the phrase format expected by Project Unmute.
 """
 
+from __future__ import annotations
+
 import os
 import sys
-import shutil
-import json
-from pathlib import Path
 
 # Target phrases we want videos for (matches SpeechRecognizer.swift mapping)
 TARGET_GLOSSES = [
@@ -42,7 +41,10 @@ TARGET_GLOSSES = [
     "finish", "done",
 ]
 
-def find_wlasl_structure(wlasl_path: Path):
+# Targets keyed by their lowercase lookup form, computed once at import
+_TARGET_DISPLAY = {g.lower(): g for g in TARGET_GLOSSES}
+
+def find_wlasl_structure(wlasl_path: os.PathLike):
     """Determine the structure of the WLASL dataset."""
     # Check for common structures
     if (wlasl_path / "videos").exists():
@@ -52,22 +54,43 @@ def find_wlasl_structure(wlasl_path: Path):
     # Might be flat structure with gloss folders
     return wlasl_path
 
-def get_video_files(videos_path: Path):
-    """Get all video files organized by gloss."""
+def first_video(gloss_path: str):
+    """Return the first .mp4 in a gloss folder, else the first .mov, else None.
+
+    Extensions match case-insensitively and dotfiles (e.g. macOS "._" resource
+    forks) are skipped.
+    """
+    first_mov = None
+    with os.scandir(gloss_path) as it:
+        for entry in it:
+            name = entry.name.lower()
+            if name.startswith("."):
+                continue
+            if name.endswith(".mp4"):
+                return entry.path
+            if first_mov is None and name.endswith(".mov"):
+                first_mov = entry.path
+    return first_mov
+
+def get_video_files(videos_path: os.PathLike):
+    """Get all video file paths (as strings) organized by gloss."""
     gloss_videos = {}
     
-    for item in videos_path.iterdir():
-        if item.is_dir():
-            # Folder structure: videos/gloss_name/video.mp4
-            gloss = item.name.lower().replace("_", " ")
-            videos = list(item.glob("*.mp4")) + list(item.glob("*.mov"))
-            if videos:
-                gloss_videos[gloss] = videos[0]  # Take first video
-        elif item.suffix.lower() in [".mp4", ".mov", ".m4v"]:
-            # Flat structure: videos/gloss_001.mp4
-            gloss = item.stem.rsplit("_", 1)[0].lower().replace("_", " ")
-            if gloss not in gloss_videos:
-                gloss_videos[gloss] = item
+    with os.scandir(videos_path) as it:
+        for entry in it:
+            if entry.is_dir():
+                # Folder structure: videos/gloss_name/video.mp4
+                gloss = entry.name.lower().replace("_", " ")
+                video = first_video(entry.path)
+                if video:
+                    gloss_videos[gloss] = video
+            else:
+                stem, ext = os.path.splitext(entry.name)
+                if ext.lower() in (".mp4", ".mov", ".m4v"):
+                    # Flat structure: videos/gloss_001.mp4
+                    gloss = stem.rsplit("_", 1)[0].lower().replace("_", " ")
+                    if gloss not in gloss_videos:
+                        gloss_videos[gloss] = entry.path
     
     return gloss_videos
 
@@ -77,6 +100,10 @@ def main():
         print("\nDownload WLASL from: https://www.kaggle.com/datasets/risangbaskoro/wlasl-processed")
         sys.exit(1)
     
+    # Deferred so the usage check above stays cheap
+    from pathlib import Path
+    from wlasl_common import copy_videos, find_best_match, write_gloss_list
+    
     wlasl_path = Path(sys.argv[1])
     if not wlasl_path.exists():
         print(f"Error: Path not found: {wlasl_path}")
@@ -103,38 +130,49 @@ def main():
     print(f"Found {len(available)} glosses in dataset")
     print()
     
+    out_dir = str(avatar_assets)
+    
+    # Exact matches first, then partial matches for whatever is left
+    matches = {}
+    unmatched = []
+    for gloss_lower, gloss in _TARGET_DISPLAY.items():
+        if gloss_lower in available:
+            matches[gloss] = available[gloss_lower]
+        else:
+            unmatched.append((gloss_lower, gloss))
+    for gloss_lower, gloss in unmatched:
+        key = find_best_match(gloss_lower, available)
+        if key is not None:
+            matches[gloss] = available[key]
+    
     # Copy matching videos
-    copied = 0
     missing = []
+    jobs = []
     
     for gloss in TARGET_GLOSSES:
         gloss_lower = gloss.lower()
         
-        # Try exact match first
-        if gloss_lower in available:
-            src = available[gloss_lower]
-        else:
-            # Try variations
-            found = None
-            for key in available:
-                if gloss_lower in key or key in gloss_lower:
-                    found = available[key]
-                    break
-            if not found:
-                missing.append(gloss)
-                continue
-            src = found
+        src = matches.get(gloss)
+        if src is None:
+            missing.append(gloss)
+            continue
         
         # Output filename (underscores for spaces)
         out_name = gloss_lower.replace(" ", "_") + ".mp4"
-        dst = avatar_assets / out_name
+        dst = os.path.join(out_dir, out_name)
         
-        print(f"  Copying: {src.name} -> {out_name}")
-        shutil.copy2(src, dst)
-        copied += 1
+        jobs.append((src, dst))
+    
+    results = copy_videos(jobs)
+    for (src, dst), was_copied in zip(jobs, results):
+        status = "Copied" if was_copied else "Up to date"
+        print(f"  {status}: {os.path.basename(src)} -> {os.path.basename(dst)}")
+    copied = sum(results)
     
     print()
     print(f"Copied {copied} videos to AvatarAssets")
+    if len(jobs) > copied:
+        print(f"{len(jobs) - copied} videos already up to date")
     
     if missing:
         print(f"\nMissing glosses ({len(missing)}):")
@@ -146,9 +184,7 @@ def main():
     # List all available glosses (for reference)
     print(f"\nAll available glosses in dataset: {len(available)}")
     glosses_file = avatar_assets / "_available_glosses.txt"
-    with open(glosses_file, "w") as f:
-        for gloss in sorted(available.keys()):
-            f.write(f"{gloss}\n")
+    write_gloss_list(glosses_file, available)
     print(f"Written to: {glosses_file}")
 
 if __name__ == "__main__":